@@ -9,15 +9,65 @@ Usage example:
 """
 
 import argparse
+import contextlib
+import functools
+import multiprocessing
 import os
 import re
 import subprocess
 import sys
 import textwrap
-from urllib.request import urlretrieve
+import time
+import xml.etree.ElementTree as ET
+from urllib.parse import quote
+from urllib.request import Request, urlopen, urlretrieve
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query?id_list={arxiv_id}"
+ARXIV_API_BATCH_URL = "https://export.arxiv.org/api/query?id_list={id_list}&max_results={count}"
+# arXiv asks API clients to leave about 3 s between requests.
+ARXIV_REQUEST_DELAY = 3.0
+ARXIV_API_BATCH_SIZE = 50
+ATOM_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+USER_AGENT = "kmscale-pubs/1.0"
 
 ARXIV_ABS_RE = re.compile(r"arxiv\.org/abs/([\w.\-]+)")
 ARXIV_PDF_RE = re.compile(r"arxiv\.org/pdf/([\w.\-]+)\.pdf")
+ARXIV_CLASS_RE = re.compile(r"\[(.+?)\]")
+ARXIV_VERSION_RE = re.compile(r"v\d+$")
+YEAR_RE = re.compile(r"(19|20)\d{2}")
+# Institution keywords, or an "@" from an email address.
+AFFILIATION_RE = re.compile(
+    r"\b(?:universit(?:y|ies)|institutes?|departments?|laborator(?:y|ies)|centres?|centers?"
+    r"|schools?|colleges?|observator(?:y|ies)|academ(?:y|ies)|facult(?:y|ies))\b|@",
+    re.IGNORECASE,
+)
+AUTHOR_NAME_RE = re.compile(r"^[A-Z][\w'.-]+(?:\s+[A-Z][\w'.-]+){1,3}$")
+WHITESPACE_RE = re.compile(r"\s+")
+MULTISPACE_RE = re.compile(r"\s{2,}")
+STAR_RE = re.compile(r"\*")
+DIGITS_RE = re.compile(r"\d+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9\s]+")
+BIB_KEY_RE = re.compile(r"@\w+\s*{\s*([^,\s]+)")
+YAML_ID_RE = re.compile(r"^\s*-\s*id:\s*(\S+)", re.MULTILINE)
+CATEGORY_RE = re.compile(
+    r"\b(?:"
+    r"(?P<forecasting>limited[- ]area|lam\b|regional|stretched[- ]grid)"
+    r"|(?P<downscaling>downscaling|super[- ]resolution|diffusion|generative)"
+    r"|(?P<global>global|medium[- ]range)"
+    r")",
+    re.IGNORECASE,
+)
+# When terms from several categories appear, the earliest listed wins.
+CATEGORY_PRIORITY = ("forecasting", "downscaling", "global")
+
+# Title, authors and the arXiv stamp all live on the first pages.
+HEADER_PAGES = 2
 
 CATEGORY_FILES = {
     "forecasting": os.path.join("database", "km_forecasting_models.yaml"),
@@ -43,16 +93,183 @@ def arxiv_abs_url(arxiv_id):
     return f"https://arxiv.org/abs/{arxiv_id}"
 
 
+def download_pdf(url, pdf_path):
+    # Download next to the target and rename on success, so an interrupted
+    # download never leaves a truncated PDF that later runs would trust.
+    part_path = f"{pdf_path}.part"
+    urlretrieve(url, part_path)
+    os.replace(part_path, pdf_path)
+
+
+def parse_arxiv_atom(data):
+    root = ET.fromstring(data)
+    entry = root.find("atom:entry", ATOM_NS)
+    # Unknown ids come back as a single entry whose id points at api/errors.
+    if entry is None or "/api/errors" in entry.findtext("atom:id", "", ATOM_NS):
+        raise RuntimeError("arXiv API returned no entry for this id.")
+    return parse_arxiv_entry(entry)
+
+
+def parse_arxiv_entry(entry):
+    def text_of(path):
+        return WHITESPACE_RE.sub(" ", entry.findtext(path, "", ATOM_NS)).strip()
+
+    authors = [
+        WHITESPACE_RE.sub(" ", name.text or "").strip()
+        for name in entry.findall("atom:author/atom:name", ATOM_NS)
+    ]
+    primary = entry.find("arxiv:primary_category", ATOM_NS)
+    if primary is None:
+        primary = entry.find("atom:category", ATOM_NS)
+
+    return {
+        "title": text_of("atom:title"),
+        "author": " and ".join(name for name in authors if name),
+        "year": text_of("atom:published")[:4],
+        "primary_class": primary.get("term", "") if primary is not None else "",
+        "abstract": text_of("atom:summary"),
+    }
+
+
+def fetch_arxiv_metadata(arxiv_id, cache_dir=None):
+    """Look up title, authors, year and primary class via the arXiv Atom API.
+
+    Raw responses are cached as ``{cache_dir}/{arxiv_id}.xml`` so repeat runs
+    don't hit the API again.
+    """
+    cache_path = _metadata_cache_path(cache_dir, arxiv_id)
+    if cache_path:
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as handle:
+                return parse_arxiv_atom(handle.read())
+
+    request = Request(
+        ARXIV_API_URL.format(arxiv_id=quote(arxiv_id)),
+        headers={"User-Agent": USER_AGENT},
+    )
+    with urlopen(request, timeout=30) as response:
+        data = response.read()
+    metadata = parse_arxiv_atom(data)
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "wb") as handle:
+            handle.write(data)
+    return metadata
+
+
+def _metadata_cache_path(cache_dir, arxiv_id):
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, f"{arxiv_id.replace('/', '_')}.xml")
+
+
+def _entries_by_id(data):
+    entries = {}
+    for entry in ET.fromstring(data).findall("atom:entry", ATOM_NS):
+        entry_url = entry.findtext("atom:id", "", ATOM_NS)
+        if "/abs/" not in entry_url:
+            continue
+        versioned = entry_url.rsplit("/abs/", 1)[1]
+        entries[versioned] = entry
+        entries.setdefault(ARXIV_VERSION_RE.sub("", versioned), entry)
+    return entries
+
+
+def fetch_arxiv_metadata_batch(arxiv_ids, cache_dir=None, delay=ARXIV_REQUEST_DELAY):
+    """Look up metadata for many ids with a few ``id_list`` Atom queries.
+
+    Returns ``(metadata, errors)``, both dicts keyed by arXiv id. Cached ids
+    are read from ``cache_dir`` and the rest are queried in chunks of
+    ``ARXIV_API_BATCH_SIZE``, ``delay`` seconds apart.
+    """
+    metadata = {}
+    errors = {}
+    pending = []
+    for arxiv_id in arxiv_ids:
+        cache_path = _metadata_cache_path(cache_dir, arxiv_id)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, "rb") as handle:
+                metadata[arxiv_id] = parse_arxiv_atom(handle.read())
+        else:
+            pending.append(arxiv_id)
+
+    for start in range(0, len(pending), ARXIV_API_BATCH_SIZE):
+        if start:
+            time.sleep(delay)
+        chunk = pending[start : start + ARXIV_API_BATCH_SIZE]
+        request = Request(
+            ARXIV_API_BATCH_URL.format(
+                id_list=",".join(quote(arxiv_id) for arxiv_id in chunk), count=len(chunk)
+            ),
+            headers={"User-Agent": USER_AGENT},
+        )
+        try:
+            with urlopen(request, timeout=30) as response:
+                entries = _entries_by_id(response.read())
+        except (OSError, ET.ParseError) as exc:
+            for arxiv_id in chunk:
+                errors[arxiv_id] = str(exc)
+            continue
+
+        for arxiv_id in chunk:
+            entry = entries.get(arxiv_id)
+            if entry is None:
+                errors[arxiv_id] = "arXiv API returned no entry for this id."
+                continue
+            metadata[arxiv_id] = parse_arxiv_entry(entry)
+            if cache_dir:
+                # Cache each entry as its own feed, the shape parse_arxiv_atom expects.
+                feed = ET.Element(f"{{{ATOM_NS['atom']}}}feed")
+                feed.append(entry)
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(_metadata_cache_path(cache_dir, arxiv_id), "wb") as handle:
+                    handle.write(ET.tostring(feed))
+    return metadata, errors
+
+
 def run_pdftotext(pdf_path):
+    """Return the text of the first ``HEADER_PAGES`` pages of ``pdf_path``.
+
+    Uses pypdf in-process when it is installed and falls back to the
+    ``pdftotext`` binary otherwise. Results are cached in memory per path and
+    mtime, and on disk as ``{pdf_path}.txt`` for later runs.
+    """
+    txt_path = f"{pdf_path}.txt"
+    if os.path.exists(txt_path) and os.path.getmtime(txt_path) >= os.path.getmtime(pdf_path):
+        with open(txt_path, "r", encoding="utf-8") as handle:
+            return handle.read()
+
+    text = _extract_header_text(os.path.abspath(pdf_path), os.stat(pdf_path).st_mtime_ns)
+    with open(txt_path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    return text
+
+
+@functools.lru_cache(maxsize=None)
+def _extract_header_text(pdf_path, mtime_ns):
+    pypdf_error = None
+    if PdfReader is not None:
+        try:
+            reader = PdfReader(pdf_path)
+            return "\n".join(page.extract_text() or "" for page in reader.pages[:HEADER_PAGES])
+        except Exception as exc:
+            # pypdf chokes on some PDFs that pdftotext handles fine.
+            pypdf_error = exc
+
     try:
         result = subprocess.run(
-            ["pdftotext", pdf_path, "-"],
+            ["pdftotext", "-l", str(HEADER_PAGES), pdf_path, "-"],
             check=True,
             capture_output=True,
             text=True,
         )
-    except FileNotFoundError:
-        raise RuntimeError("pdftotext is required but was not found in PATH.")
+    except FileNotFoundError as exc:
+        if pypdf_error is not None:
+            raise RuntimeError(
+                f"pypdf failed ({pypdf_error}) and pdftotext is not in PATH."
+            ) from pypdf_error
+        raise RuntimeError("pypdf or pdftotext is required but neither is available.") from exc
     return result.stdout
 
 
@@ -69,29 +286,14 @@ def extract_basic_metadata(text):
         if stripped.startswith("arXiv:"):
             arxiv_line = stripped
 
-    affiliation_keywords = {
-        "university",
-        "institute",
-        "department",
-        "laboratory",
-        "centre",
-        "center",
-        "school",
-        "college",
-        "observatory",
-        "academy",
-        "faculty",
-    }
-
     def looks_like_affiliation(line):
-        lower = line.lower()
-        return any(keyword in lower for keyword in affiliation_keywords) or "@" in line
+        return bool(AFFILIATION_RE.search(line))
 
     def looks_like_author(line):
         stripped = line.strip()
         if not stripped or looks_like_affiliation(stripped):
             return False
-        words = [word for word in re.split(r"\\s+", stripped) if word]
+        words = [word for word in WHITESPACE_RE.split(stripped) if word]
         if not (1 < len(words) <= 5):
             return False
         for word in words:
@@ -126,7 +328,6 @@ def extract_basic_metadata(text):
     title = " ".join(title_lines).replace("  ", " ").strip()
 
     author_lines = []
-    name_pattern = re.compile(r"^[A-Z][\\w'.-]+(?:\\s+[A-Z][\\w'.-]+){1,3}$")
     remaining_lines = header_lines[title_end_index + 1 :]
     for idx, line in enumerate(remaining_lines):
         stripped = line.strip()
@@ -135,25 +336,25 @@ def extract_basic_metadata(text):
             continue
         if "," in stripped:
             continue
-        if name_pattern.match(stripped) or looks_like_affiliation(next_line):
+        if AUTHOR_NAME_RE.match(stripped) or looks_like_affiliation(next_line):
             author_lines.append(stripped)
 
     authors_raw = " and ".join(author_lines).replace("  ", " ").strip()
 
     # Clean author markers like *, digits, and superscripts.
-    authors_raw = re.sub(r"\*", "", authors_raw)
-    authors_raw = re.sub(r"\d+", "", authors_raw)
-    authors_raw = re.sub(r"\s{2,}", " ", authors_raw).strip(", ")
+    authors_raw = STAR_RE.sub("", authors_raw)
+    authors_raw = DIGITS_RE.sub("", authors_raw)
+    authors_raw = MULTISPACE_RE.sub(" ", authors_raw).strip(", ")
 
     author_field = authors_raw
 
     year = ""
     primary_class = ""
     if arxiv_line:
-        class_match = re.search(r"\[(.+?)\]", arxiv_line)
+        class_match = ARXIV_CLASS_RE.search(arxiv_line)
         if class_match:
             primary_class = class_match.group(1)
-        year_match = re.search(r"(19|20)\d{2}", arxiv_line)
+        year_match = YEAR_RE.search(arxiv_line)
         if year_match:
             year = year_match.group(0)
 
@@ -166,50 +367,44 @@ def extract_basic_metadata(text):
 
 
 def infer_category(text):
-    lower = text.lower()
-    downscaling_terms = [
-        "downscaling",
-        "super-resolution",
-        "super resolution",
-        "diffusion",
-        "generative",
-    ]
-    forecasting_terms = [
-        "limited-area",
-        "limited area",
-        "lam ",
-        "regional",
-        "stretched-grid",
-        "stretched grid",
-    ]
-    global_terms = [
-        "global",
-        "medium-range",
-        "medium range",
-    ]
-
-    if any(term in lower for term in forecasting_terms):
-        return "forecasting"
-
-    if any(term in lower for term in downscaling_terms):
-        return "downscaling"
+    found = set()
+    for match in CATEGORY_RE.finditer(text):
+        if match.lastgroup == CATEGORY_PRIORITY[0]:
+            return match.lastgroup
+        found.add(match.lastgroup)
 
-    if any(term in lower for term in global_terms):
-        return "global"
+    for category in CATEGORY_PRIORITY:
+        if category in found:
+            return category
 
     raise RuntimeError(
         "Unable to infer category. Pass --category forecasting|downscaling|global to override."
     )
 
 
-def bib_entry_exists(path, key):
-    if not os.path.exists(path):
-        return False
+@functools.lru_cache(maxsize=None)
+def _scan_ids(path, pattern, mtime_ns, size):
     with open(path, "r", encoding="utf-8") as handle:
-        return f"@misc{{{key}," in handle.read()
+        return frozenset(match.group(1) for match in pattern.finditer(handle.read()))
 
 
-def append_bib_entry(path, key, metadata, arxiv_id):
+def _load_ids(path, pattern):
+    # Keyed on mtime and size so appends made since the last scan are seen.
+    if not os.path.exists(path):
+        return frozenset()
+    stat = os.stat(path)
+    return _scan_ids(os.path.abspath(path), pattern, stat.st_mtime_ns, stat.st_size)
+
+
+def load_bib_keys(path):
+    return _load_ids(path, BIB_KEY_RE)
+
+
+def load_yaml_ids(path):
+    return _load_ids(path, YAML_ID_RE)
+
+
+def render_bib_entry(key, metadata, arxiv_id):
     entry = textwrap.dedent(
         f"""
         @misc{{{key},
@@ -223,19 +418,10 @@ def append_bib_entry(path, key, metadata, arxiv_id):
         }}
         """
     ).lstrip("\n")
-
-    with open(path, "a", encoding="utf-8") as handle:
-        handle.write("\n" + entry)
-
-
-def yaml_entry_exists(path, key):
-    if not os.path.exists(path):
-        return False
-    with open(path, "r", encoding="utf-8") as handle:
-        return f"- id: {key}" in handle.read()
+    return "\n" + entry
 
 
-def append_yaml_entry(path, key):
+def render_yaml_entry(key):
     skeleton = textwrap.dedent(
         f"""
           - id: {key}
@@ -250,20 +436,18 @@ def append_yaml_entry(path, key):
             tags: []
         """
     ).rstrip()
-
-    with open(path, "a", encoding="utf-8") as handle:
-        handle.write("\n" + skeleton + "\n")
+    return "\n" + skeleton + "\n"
 
 
 def generate_id(metadata):
     author_field = metadata.get("author", "")
     first_author = author_field.split(" and ")[0] if author_field else "unknown"
-    last_name = re.split(r"\s+", first_author.strip())[-1].lower()
-    last_name = re.sub(r"[^a-z0-9]+", "", last_name)
+    last_name = WHITESPACE_RE.split(first_author.strip())[-1].lower()
+    last_name = NON_ALNUM_RE.sub("", last_name)
 
     year = metadata.get("year", "") or "0000"
     title = metadata.get("title", "").lower()
-    title = re.sub(r"[^a-z0-9\\s]+", "", title)
+    title = NON_ALNUM_SPACE_RE.sub("", title)
     title_words = [word for word in title.split() if word not in {"a", "an", "the", "for", "and"}]
     slug = "_".join(title_words[:3]) if title_words else "paper"
     slug = slug[:40].strip("_") or "paper"
@@ -271,9 +455,175 @@ def generate_id(metadata):
     return f"{last_name}{year}_{slug}"
 
 
+def read_batch_file(path):
+    """Return the arXiv ids listed in ``path``, in order and without duplicates."""
+    with open(path, "r", encoding="utf-8") as handle:
+        lines = [line.split("#", 1)[0].strip() for line in handle]
+
+    arxiv_ids = {}
+    for line in lines:
+        if not line:
+            continue
+        arxiv_id = normalize_arxiv_id(line)
+        if arxiv_id in arxiv_ids:
+            print(f"Warning: duplicate arXiv id {arxiv_id} ({line}), ignoring later entry.")
+            continue
+        arxiv_ids[arxiv_id] = line
+    return list(arxiv_ids)
+
+
+# Shared (next free slot, delay) for PDF downloads across --batch workers.
+_download_slot = None
+
+
+def _init_batch_worker(next_slot, delay):
+    global _download_slot
+    _download_slot = (next_slot, delay)
+
+
+def wait_for_download_slot():
+    """Space out PDF downloads from all batch workers by the configured delay."""
+    if _download_slot is None:
+        return
+    next_slot, delay = _download_slot
+    with next_slot.get_lock():
+        now = time.time()
+        slot = max(now, next_slot.value)
+        next_slot.value = slot + delay
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def process_one(url_or_id, args, paper_id=None, metadata=None, lookup_error=None):
+    """Download one paper and work out its metadata, id and catalog.
+
+    Returns ``(arxiv_id, paper_id, metadata, category)``. Writing the
+    catalogs is left to the caller so batch runs can do it in one place.
+    Batch runs look metadata up in the parent and pass either ``metadata``
+    or ``lookup_error``, so only single-paper runs query the API here.
+    """
+    arxiv_id = normalize_arxiv_id(url_or_id)
+    pdf_url = arxiv_pdf_url(arxiv_id)
+
+    temp_pdf_path = os.path.join(args.pdf_dir, f"{arxiv_id}.pdf")
+    pdf_path = temp_pdf_path
+    if args.no_pdf:
+        pass
+    elif os.path.exists(pdf_path) and not args.force:
+        print(f"PDF already exists: {pdf_path}")
+    else:
+        wait_for_download_slot()
+        print(f"Downloading {pdf_url}")
+        download_pdf(pdf_url, pdf_path)
+
+    if metadata is None and lookup_error is None:
+        try:
+            metadata = fetch_arxiv_metadata(arxiv_id, os.path.join(args.pdf_dir, ".arxiv_meta"))
+        except (OSError, ET.ParseError, RuntimeError) as exc:
+            lookup_error = exc
+
+    if metadata is not None:
+        category_text = f"{metadata['title']}\n{metadata['abstract']}"
+    else:
+        if args.no_pdf:
+            raise RuntimeError(
+                f"arXiv API lookup failed for {arxiv_id} ({lookup_error}), rerun without --no-pdf."
+            )
+        print(f"Warning: arXiv API lookup failed for {arxiv_id} ({lookup_error}), falling back to PDF text.")
+        text = run_pdftotext(pdf_path)
+        metadata = extract_basic_metadata(text)
+        category_text = text
+    category = args.category or infer_category(category_text)
+
+    if not metadata["title"]:
+        raise RuntimeError(f"Failed to determine the title of {arxiv_id}.")
+
+    paper_id = paper_id or generate_id(metadata)
+    if not args.no_pdf:
+        final_pdf_path = os.path.join(args.pdf_dir, f"{paper_id}.pdf")
+        if os.path.exists(final_pdf_path) and not args.force:
+            raise RuntimeError(f"PDF already exists: {final_pdf_path}")
+        if final_pdf_path != pdf_path:
+            os.replace(pdf_path, final_pdf_path)
+            if os.path.exists(f"{pdf_path}.txt"):
+                os.replace(f"{pdf_path}.txt", f"{final_pdf_path}.txt")
+
+    if not metadata["year"]:
+        print(f"Warning: could not infer year for {paper_id}, leaving blank.")
+
+    return arxiv_id, paper_id, metadata, category
+
+
+def _process_batch_item(arxiv_id, args, metadata, lookup_error):
+    # Report failures back to the parent instead of aborting the whole pool.
+    try:
+        return process_one(arxiv_id, args, metadata=metadata, lookup_error=lookup_error), None
+    except Exception as exc:
+        return None, f"{arxiv_id}: {exc}"
+
+
+class CatalogWriter:
+    """Collect text to append to ``path`` and write it in one go on exit.
+
+    The old contents plus the new chunks are written to ``{path}.tmp`` and
+    moved over ``path`` with ``os.replace``, so a crash never leaves a
+    half-written entry behind. Nothing is written if the block raises.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._chunks = []
+
+    def append(self, text):
+        self._chunks.append(text)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None or not self._chunks:
+            return False
+        existing = ""
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8", newline="") as handle:
+                existing = handle.read()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as handle:
+            handle.write(existing + "".join(self._chunks))
+        os.replace(tmp_path, self.path)
+        return False
+
+
+def write_entries(args, results):
+    """Append BibTeX entries and YAML skeletons for ``results`` with one write per file."""
+    bib_keys = set(load_bib_keys(args.bib))
+    yaml_ids = {}
+    with contextlib.ExitStack() as stack:
+        bib = stack.enter_context(CatalogWriter(args.bib))
+        yaml_writers = {}
+        for arxiv_id, paper_id, metadata, category in results:
+            if paper_id not in bib_keys or args.force:
+                bib_keys.add(paper_id)
+                bib.append(render_bib_entry(paper_id, metadata, arxiv_id))
+                print(f"Appending BibTeX entry {paper_id} to {args.bib}")
+            else:
+                print(f"BibTeX entry already exists: {paper_id}")
+
+            yaml_path = CATEGORY_FILES[category]
+            if yaml_path not in yaml_writers:
+                yaml_ids[yaml_path] = set(load_yaml_ids(yaml_path))
+                yaml_writers[yaml_path] = stack.enter_context(CatalogWriter(yaml_path))
+            if paper_id not in yaml_ids[yaml_path] or args.force:
+                yaml_ids[yaml_path].add(paper_id)
+                yaml_writers[yaml_path].append(render_yaml_entry(paper_id))
+                print(f"Appending YAML skeleton {paper_id} to {yaml_path}")
+            else:
+                print(f"YAML entry already exists: {paper_id}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Add an arXiv paper to the catalogs.")
-    parser.add_argument("url", help="arXiv abs/pdf URL or arXiv id")
+    parser.add_argument("url", nargs="?", help="arXiv abs/pdf URL or arXiv id")
     parser.add_argument("--id", help="BibTeX key / YAML id to use")
     parser.add_argument(
         "--category",
@@ -295,50 +645,66 @@ def main():
         action="store_true",
         help="Overwrite existing PDF and append entries even if present.",
     )
+    parser.add_argument(
+        "--no-pdf",
+        action="store_true",
+        help="Only fetch metadata from the arXiv API; don't download the PDF.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="PATH",
+        help="File with one arXiv URL or id per line to add in a single run.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of papers to process in parallel with --batch.",
+    )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=ARXIV_REQUEST_DELAY,
+        help="Minimum delay in seconds between requests to arXiv with --batch.",
+    )
 
     args = parser.parse_args()
-
-    arxiv_id = normalize_arxiv_id(args.url)
-    pdf_url = arxiv_pdf_url(arxiv_id)
+    if bool(args.url) == bool(args.batch):
+        parser.error("pass either an arXiv URL/id or --batch PATH")
+    if args.batch and args.id:
+        parser.error("--id cannot be combined with --batch")
 
     os.makedirs(args.pdf_dir, exist_ok=True)
-    temp_pdf_path = os.path.join(args.pdf_dir, f"{arxiv_id}.pdf")
-    pdf_path = temp_pdf_path
-    if os.path.exists(pdf_path) and not args.force:
-        print(f"PDF already exists: {pdf_path}")
+    errors = []
+    if args.batch:
+        arxiv_ids = read_batch_file(args.batch)
+        metadata, lookup_errors = fetch_arxiv_metadata_batch(
+            arxiv_ids, os.path.join(args.pdf_dir, ".arxiv_meta"), args.delay
+        )
+        # Start the first download one delay after the last API query.
+        next_slot = multiprocessing.Value("d", time.time() + args.delay)
+        with multiprocessing.Pool(
+            max(1, args.workers), initializer=_init_batch_worker, initargs=(next_slot, args.delay)
+        ) as pool:
+            outcomes = pool.starmap(
+                _process_batch_item,
+                [
+                    (arxiv_id, args, metadata.get(arxiv_id), lookup_errors.get(arxiv_id))
+                    for arxiv_id in arxiv_ids
+                ],
+            )
+        results = [result for result, error in outcomes if result]
+        errors = [error for result, error in outcomes if error]
     else:
-        print(f"Downloading {pdf_url}")
-        urlretrieve(pdf_url, pdf_path)
-
-    text = run_pdftotext(pdf_path)
-    metadata = extract_basic_metadata(text)
-    category = args.category or infer_category(text)
+        results = [process_one(args.url, args, args.id)]
 
-    if not metadata["title"]:
-        raise RuntimeError("Failed to extract title from PDF.")
-
-    paper_id = args.id or generate_id(metadata)
-    final_pdf_path = os.path.join(args.pdf_dir, f"{paper_id}.pdf")
-    if os.path.exists(final_pdf_path) and not args.force:
-        raise RuntimeError(f"PDF already exists: {final_pdf_path}")
-    if final_pdf_path != pdf_path:
-        os.replace(pdf_path, final_pdf_path)
-
-    if not metadata["year"]:
-        print("Warning: could not infer year from PDF, leaving blank.")
+    write_entries(args, results)
 
-    if not bib_entry_exists(args.bib, paper_id) or args.force:
-        append_bib_entry(args.bib, paper_id, metadata, arxiv_id)
-        print(f"Appended BibTeX entry to {args.bib}")
-    else:
-        print(f"BibTeX entry already exists: {paper_id}")
-
-    yaml_path = CATEGORY_FILES[category]
-    if not yaml_entry_exists(yaml_path, paper_id) or args.force:
-        append_yaml_entry(yaml_path, paper_id)
-        print(f"Appended YAML skeleton to {yaml_path}")
-    else:
-        print(f"YAML entry already exists: {paper_id}")
+    if errors:
+        print("\nFailed papers:")
+        for error in errors:
+            print(f"- {error}")
+        raise RuntimeError(f"{len(errors)} of {len(arxiv_ids)} papers could not be added.")
 
     print("Done. Review the generated BibTeX/YAML entries for correctness.")
 
@@ -2,44 +2,91 @@
 """Download PDFs for BibTeX entries into ./pdfs using the citation key as filename."""
 
 import argparse
+import asyncio
+import json
 import os
 import re
+import shutil
 import sys
+import threading
 import time
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from urllib.error import ContentTooShortError, HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
 
-ENTRY_START_RE = re.compile(r"@\w+\s*{", re.IGNORECASE)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+ENTRY_START_RE = re.compile(rb"@\w+\s*{", re.IGNORECASE)
 KEY_RE = re.compile(r"@\w+\s*{\s*([^,\s]+)", re.IGNORECASE)
+FIELD_START_RE = re.compile(r"[^\n\r\t ,]")
+VALUE_START_RE = re.compile(r"[^ \t\n\r]")
+VALUE_END_RE = re.compile(r"[,\n]")
+CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-\d+/(\d+|\*)")
+
+USER_AGENT = "kmscale-pubs/1.0"
+REQUEST_TIMEOUT = 30
+MAX_REDIRECTS = 5
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+COPY_CHUNK_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 0.25
+
+# Keep-alive connections, one per (scheme, host) for each worker thread.
+_connections = threading.local()
+
+
+def find_matching_brace(text, start):
+    """Return the index just past the ``}`` closing the ``{`` at ``start``, or -1.
+
+    ``text`` may be ``str`` or ``bytes``.
+    """
+    open_brace, close_brace = (b"{", b"}") if isinstance(text, bytes) else ("{", "}")
+    depth = 1
+    scan = start + 1
+    next_close = text.find(close_brace, scan)
+    while next_close != -1:
+        next_open = text.find(open_brace, scan, next_close)
+        if next_open != -1:
+            depth += 1
+            scan = next_open + 1
+            continue
+        depth -= 1
+        scan = next_close + 1
+        if depth == 0:
+            return scan
+        next_close = text.find(close_brace, scan)
+    return -1
+
 
+def extract_entries(data):
+    """Yield each ``@type{...}`` entry in the raw BibTeX ``data`` as text.
 
-def extract_entries(text):
-    entries = []
+    Entry boundaries are found on the undecoded bytes; only the entries
+    themselves are decoded, with undecodable bytes replaced.
+    """
+    view = memoryview(data)
     idx = 0
     while True:
-        match = ENTRY_START_RE.search(text, idx)
+        match = ENTRY_START_RE.search(data, idx)
         if not match:
             break
         start = match.start()
-        brace_idx = text.find("{", match.end() - 1)
-        if brace_idx == -1:
+        brace_idx = match.end() - 1
+        end = find_matching_brace(data, brace_idx)
+        if end == -1:
             break
-        depth = 0
-        end = None
-        for pos in range(brace_idx, len(text)):
-            char = text[pos]
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    end = pos + 1
-                    break
-        if end is None:
-            break
-        entries.append(text[start:end])
+        entry = str(view[start:end], "utf-8", "replace")
+        if "\r" in entry:
+            entry = entry.replace("\r\n", "\n").replace("\r", "\n")
+        yield entry
         idx = end
-    return entries
 
 
 def parse_fields(entry_text):
@@ -60,53 +107,45 @@ def parse_fields(entry_text):
     i = 0
     length = len(fields_text)
     while i < length:
-        while i < length and fields_text[i] in "\n\r\t ,":
-            i += 1
-        if i >= length:
+        match = FIELD_START_RE.search(fields_text, i)
+        if not match:
+            break
+        key_start = match.start()
+        i = fields_text.find("=", key_start)
+        if i == -1:
             break
-        key_start = i
-        while i < length and fields_text[i] not in "=":
-            i += 1
         field_key = fields_text[key_start:i].strip().lower()
         if not field_key:
             break
-        i += 1
-        while i < length and fields_text[i] in " \t\n\r":
-            i += 1
-        if i >= length:
+        match = VALUE_START_RE.search(fields_text, i + 1)
+        if not match:
             break
+        i = match.start()
         delimiter = fields_text[i]
-        value = ""
-        if delimiter in "{\"":
-            if delimiter == "{":
-                i += 1
-                depth = 1
-                value_start = i
-                while i < length and depth > 0:
-                    if fields_text[i] == "{":
-                        depth += 1
-                    elif fields_text[i] == "}":
-                        depth -= 1
-                    i += 1
-                value = fields_text[value_start : i - 1].strip()
-            else:
-                i += 1
-                value_start = i
-                while i < length and fields_text[i] != "\"":
-                    i += 1
-                value = fields_text[value_start:i].strip()
-                i += 1
-        else:
-            value_start = i
-            while i < length and fields_text[i] not in ",\n":
-                i += 1
+        if delimiter == "{":
+            value_start = i + 1
+            i = find_matching_brace(fields_text, i)
+            if i == -1:
+                i = length + 1
+            value = fields_text[value_start : i - 1].strip()
+        elif delimiter == "\"":
+            value_start = i + 1
+            i = fields_text.find("\"", value_start)
+            if i == -1:
+                i = length
             value = fields_text[value_start:i].strip()
-        fields[field_key] = value
-        while i < length and fields_text[i] not in "\n":
-            if fields_text[i] == ",":
-                i += 1
-                break
             i += 1
+        else:
+            match = VALUE_END_RE.search(fields_text, i)
+            value_end = match.start() if match else length
+            value = fields_text[i:value_end].strip()
+            i = value_end
+        fields[field_key] = value
+        # Step past the separating comma; a newline ends the field as well.
+        match = VALUE_END_RE.search(fields_text, i)
+        if not match:
+            break
+        i = match.end() if match.group() == "," else match.start()
     return key, fields
 
 
@@ -132,28 +171,398 @@ def derive_pdf_url(fields):
     return None
 
 
-def download_with_progress(url, dest_path, index, total):
-    request = Request(url, headers={"User-Agent": "kmscale-pubs/1.0"})
-    with urlopen(request, timeout=30) as response:
-        total_bytes = response.headers.get("Content-Length")
-        total_bytes = int(total_bytes) if total_bytes and total_bytes.isdigit() else None
-        downloaded = 0
-        chunk_size = 1024 * 64
-
-        with open(dest_path, "wb") as file_handle:
-            while True:
-                chunk = response.read(chunk_size)
-                if not chunk:
-                    break
-                file_handle.write(chunk)
-                downloaded += len(chunk)
-                if total_bytes:
-                    percent = downloaded / total_bytes * 100
-                    status = f"[{index}/{total}] {os.path.basename(dest_path)} {percent:5.1f}%"
+def parse_entries(data):
+    """Parse raw BibTeX ``data`` into ``(key, fields)`` pairs, one per unique key.
+
+    When a key appears more than once the first entry wins, so no two
+    downloads ever target the same file.
+    """
+    parsed = {}
+    for entry in extract_entries(data):
+        key, fields = parse_fields(entry)
+        if not key:
+            continue
+        if key in parsed:
+            print(f"Warning: duplicate BibTeX key {key}, ignoring later entry.")
+            continue
+        parsed[key] = fields
+    return list(parsed.items())
+
+
+def scan_existing_pdfs(directory):
+    """Scan ``directory`` once for ``<key>.pdf`` files and their sidecars.
+
+    Returns ``(sizes, sidecars)``: a dict of key to PDF size and the set of
+    keys that have a ``<key>.pdf.meta.json`` sidecar.
+    """
+    sizes = {}
+    sidecars = set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf.meta.json"):
+                sidecars.add(entry.name[: -len(".pdf.meta.json")])
+            elif entry.name.endswith(".pdf") and entry.is_file():
+                sizes[entry.name[:-4]] = entry.stat().st_size
+    return sizes, sidecars
+
+
+class HostRateLimiter:
+    """Space out request starts to the same host by at least ``delay`` seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def reserve(self, url):
+        """Claim the next request slot for ``url``'s host; return seconds to wait for it."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        return slot - now
+
+    def wait(self, url):
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _get_connection(scheme, netloc):
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        conn_class = HTTPSConnection if scheme == "https" else HTTPConnection
+        conn = pool[(scheme, netloc)] = conn_class(netloc, timeout=REQUEST_TIMEOUT)
+    return conn
+
+
+def _drop_connection(scheme, netloc):
+    conn = getattr(_connections, "pool", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+@contextmanager
+def open_url(url, headers=None):
+    """GET ``url`` over a pooled keep-alive connection, following redirects.
+
+    Connection errors and 429/5xx responses are retried with exponential
+    backoff. Other error statuses raise ``HTTPError`` and connection failures
+    raise ``URLError``, matching ``urllib.request.urlopen``.
+    """
+    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+    redirects = 0
+    attempt = 0
+    while True:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        conn = _get_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+        except (OSError, HTTPException) as exc:
+            # Also covers keep-alive sockets the server has since closed.
+            _drop_connection(parts.scheme, parts.netloc)
+            if attempt >= MAX_RETRIES:
+                raise URLError(exc) from exc
+            time.sleep(RETRY_BACKOFF * 2**attempt)
+            attempt += 1
+            continue
+
+        location = response.getheader("Location")
+        if response.status in REDIRECT_STATUSES and location and redirects < MAX_REDIRECTS:
+            response.read()
+            url = urljoin(url, location)
+            redirects += 1
+            continue
+        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+            response.read()
+            time.sleep(RETRY_BACKOFF * 2**attempt)
+            attempt += 1
+            continue
+        if response.status >= 400:
+            response.read()
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        if response.status not in (200, 206, 304):
+            # Redirect loops and redirects without a Location end up here.
+            response.read()
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        break
+
+    try:
+        yield response
+    finally:
+        # A partially read body leaves the socket mid-stream, so it can't be reused.
+        if not response.isclosed():
+            _drop_connection(parts.scheme, parts.netloc)
+
+
+class _ProgressReader:
+    """Wrap a readable response, repainting a progress line at most every ``interval`` seconds."""
+
+    def __init__(self, response, label, total_bytes, downloaded=0, interval=PROGRESS_INTERVAL):
+        self._response = response
+        self._label = label
+        self._total_bytes = total_bytes
+        self._interval = interval
+        self._last_print = 0.0
+        self.downloaded = downloaded
+
+    def read(self, size=-1):
+        chunk = self._response.read(size)
+        self.downloaded += len(chunk)
+        now = time.monotonic()
+        if now - self._last_print >= self._interval:
+            self._last_print = now
+            if self._total_bytes:
+                percent = self.downloaded / self._total_bytes * 100
+                status = f"{self._label} {percent:5.1f}%"
+            else:
+                status = f"{self._label} {self.downloaded // 1024} KB"
+            print(status, end="\r", flush=True)
+        return chunk
+
+
+def sidecar_path(path):
+    return f"{path}.meta.json"
+
+
+def read_sidecar(path):
+    try:
+        with open(sidecar_path(path), "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_sidecar(path, meta):
+    with open(sidecar_path(path), "w", encoding="utf-8") as handle:
+        json.dump(meta, handle, indent=2)
+
+
+def remove_partial(part_path):
+    for path in (part_path, sidecar_path(part_path)):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def is_complete(dest_path, size, has_sidecar):
+    """Check a PDF of ``size`` bytes found by ``scan_existing_pdfs``."""
+    if size == 0:
+        return False
+    expected = read_sidecar(dest_path).get("content_length") if has_sidecar else None
+    return expected is None or size == expected
+
+
+def request_headers(dest_path, revalidate):
+    """Return ``(headers, resume_from)`` for a download to ``dest_path``.
+
+    A ``.part`` file left by an earlier attempt is resumed with a ``Range``
+    header. With ``revalidate``, the validators from a previous download are
+    sent as ``If-None-Match``/``If-Modified-Since``.
+    """
+    headers = {}
+    if revalidate and os.path.exists(dest_path):
+        meta = read_sidecar(dest_path)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    part_path = f"{dest_path}.part"
+    resume_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if resume_from:
+        headers["Range"] = f"bytes={resume_from}-"
+        # Only resume if the server still has the same file as the partial one.
+        part_meta = read_sidecar(part_path)
+        validator = part_meta.get("etag") or part_meta.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+    return headers, resume_from
+
+
+def start_body(status, headers, part_path, resume_from):
+    """Check a 200/206 response against the partial file and record its validators.
+
+    Returns ``(mode, expected, resume_from, meta)``: the mode to open the
+    ``.part`` file with, the expected final size (or None) and the offset the
+    body starts at.
+    """
+    if status == 206:
+        match = CONTENT_RANGE_RE.match(headers.get("Content-Range", ""))
+        if not match or int(match.group(1)) != resume_from:
+            remove_partial(part_path)
+            raise URLError("server sent an unexpected Content-Range")
+        mode = "ab"
+        expected = int(match.group(2)) if match.group(2).isdigit() else None
+    else:
+        mode = "wb"
+        resume_from = 0
+        expected = headers.get("Content-Length")
+        expected = int(expected) if expected and expected.isdigit() else None
+
+    meta = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "content_length": expected,
+    }
+    write_sidecar(part_path, meta)
+    return mode, expected, resume_from, meta
+
+
+def finish_download(part_path, dest_path, expected, meta):
+    size = os.path.getsize(part_path)
+    if expected is not None and size != expected:
+        raise ContentTooShortError(f"retrieval incomplete: got {size} of {expected} bytes", None)
+    meta["content_length"] = size
+    os.replace(part_path, dest_path)
+    write_sidecar(dest_path, meta)
+    os.remove(sidecar_path(part_path))
+
+
+def download_with_progress(url, dest_path, index, total, show_progress=True, revalidate=False):
+    """Download ``url`` to ``dest_path`` and record its validators in a sidecar.
+
+    The body is written to ``{dest_path}.part`` first and renamed once it is
+    complete. Returns False if the server answers 304 Not Modified, True if a
+    new copy was written.
+    """
+    headers, resume_from = request_headers(dest_path, revalidate)
+    part_path = f"{dest_path}.part"
+    try:
+        with open_url(url, headers) as response:
+            if response.status == 304:
+                response.read()
+                remove_partial(part_path)
+                return False
+
+            mode, expected, resume_from, meta = start_body(
+                response.status, response.headers, part_path, resume_from
+            )
+            source = response
+            if show_progress:
+                label = f"[{index}/{total}] {os.path.basename(dest_path)}"
+                source = _ProgressReader(response, label, expected, downloaded=resume_from)
+
+            with open(part_path, mode) as file_handle:
+                shutil.copyfileobj(source, file_handle, length=COPY_CHUNK_SIZE)
+    except HTTPError as exc:
+        if exc.code != 416 or not resume_from:
+            raise
+        # The partial file doesn't fit the server's copy; start over.
+        remove_partial(part_path)
+        return download_with_progress(url, dest_path, index, total, show_progress, revalidate)
+
+    finish_download(part_path, dest_path, expected, meta)
+    if show_progress:
+        print(" " * 80, end="\r", flush=True)
+    return True
+
+
+def download_one(pdf_url, dest_path, index, total, limiter, show_progress, revalidate):
+    limiter.wait(pdf_url)
+    try:
+        downloaded = download_with_progress(
+            pdf_url, dest_path, index, total, show_progress, revalidate
+        )
+    except (HTTPError, URLError, HTTPException, TimeoutError, ConnectionError) as exc:
+        # Any partial file is kept so the next run can resume it.
+        return "failed", str(exc)
+    return ("downloaded" if downloaded else "unchanged"), None
+
+
+def download_all(jobs, total, workers, limiter, revalidate, report):
+    # Per-chunk progress lines interleave across threads, so only show them
+    # when downloading serially.
+    show_progress = workers == 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                download_one,
+                pdf_url,
+                dest_path,
+                index,
+                total,
+                limiter,
+                show_progress,
+                revalidate,
+            ): (index, key)
+            for index, key, pdf_url, dest_path in jobs
+        }
+        for future in as_completed(futures):
+            index, key = futures[future]
+            report(index, key, *future.result())
+
+
+async def fetch_async(session, url, dest_path, revalidate):
+    """Async counterpart of ``download_with_progress`` built on aiohttp."""
+    part_path = f"{dest_path}.part"
+    attempt = 0
+    while True:
+        # Recomputed per attempt, so a retry resumes whatever was written so far.
+        headers, resume_from = request_headers(dest_path, revalidate)
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    pass  # retried below, once the response is released
+                elif response.status == 416 and resume_from:
+                    remove_partial(part_path)
+                    continue
+                elif response.status >= 400:
+                    raise HTTPError(
+                        str(response.url), response.status, response.reason, response.headers, None
+                    )
+                elif response.status == 304:
+                    remove_partial(part_path)
+                    return False
                 else:
-                    status = f"[{index}/{total}] {os.path.basename(dest_path)} {downloaded // 1024} KB"
-                print(status, end="\r", flush=True)
-    print(" " * 80, end="\r", flush=True)
+                    mode, expected, _, meta = start_body(
+                        response.status, response.headers, part_path, resume_from
+                    )
+                    with open(part_path, mode) as file_handle:
+                        async for chunk in response.content.iter_chunked(COPY_CHUNK_SIZE):
+                            file_handle.write(chunk)
+                    finish_download(part_path, dest_path, expected, meta)
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= MAX_RETRIES:
+                raise
+        await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+        attempt += 1
+
+
+async def download_all_async(jobs, total, workers, limiter, revalidate, report):
+    semaphore = asyncio.Semaphore(workers)
+    timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit=workers)
+
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}
+    ) as session:
+
+        async def run(index, key, pdf_url, dest_path):
+            async with semaphore:
+                await asyncio.sleep(limiter.reserve(pdf_url))
+                try:
+                    downloaded = await fetch_async(session, pdf_url, dest_path, revalidate)
+                except (
+                    HTTPError,
+                    URLError,
+                    aiohttp.ClientError,
+                    asyncio.TimeoutError,
+                    ConnectionError,
+                ) as exc:
+                    report(index, key, "failed", str(exc) or type(exc).__name__)
+                    return
+            report(index, key, "downloaded" if downloaded else "unchanged", None)
+
+        await asyncio.gather(*(run(*job) for job in jobs))
 
 
 def main():
@@ -173,51 +582,105 @@ def main():
         action="store_true",
         help="Redownload PDFs even if they already exist.",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Revalidate existing PDFs with the server and redownload only those that changed.",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Download with a thread pool even if aiohttp is installed.",
+    )
+    parser.add_argument(
+        "--metadata-only",
+        action="store_true",
+        help="Only resolve and list PDF urls without downloading.",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="With --metadata-only, exit 1 if any entry has no PDF url.",
+    )
     parser.add_argument(
         "--delay",
         type=float,
         default=0.25,
-        help="Delay between downloads in seconds.",
+        help="Minimum delay between requests to the same host in seconds.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent downloads.",
     )
     args = parser.parse_args()
 
-    with open(args.bib, "r", encoding="utf-8") as handle:
-        text = handle.read()
+    with open(args.bib, "rb") as handle:
+        data = handle.read()
 
-    entries = extract_entries(text)
-    parsed = []
-    for entry in entries:
-        key, fields = parse_fields(entry)
-        if key:
-            parsed.append((key, fields))
+    parsed = parse_entries(data)
+    total = len(parsed)
+
+    if args.metadata_only:
+        resolved = [(key, derive_pdf_url(fields)) for key, fields in parsed]
+        for index, (key, pdf_url) in enumerate(resolved, start=1):
+            print(f"[{index}/{total}] {key}: {pdf_url or 'no PDF url found'}")
+        missing = [key for key, pdf_url in resolved if not pdf_url]
+        if missing:
+            print("\nEntries without a PDF url:")
+            for key in missing:
+                print(f"- {key}")
+            print(f"\n{len(missing)} of {total} entries have no PDF url.")
+            if args.strict:
+                sys.exit(1)
+            return
+        print(f"\nAll {total} entries resolve to a PDF url.")
+        return
 
     os.makedirs(args.out, exist_ok=True)
 
-    total = len(parsed)
+    if args.force or args.refresh:
+        sizes, sidecars = {}, set()
+    else:
+        sizes, sidecars = scan_existing_pdfs(args.out)
     skipped = []
     failed = []
+    jobs = []
+    present = 0
 
     for index, (key, fields) in enumerate(parsed, start=1):
+        dest_path = os.path.join(args.out, f"{key}.pdf")
+        if key in sizes and is_complete(dest_path, sizes[key], key in sidecars):
+            present += 1
+            continue
+
         pdf_url = derive_pdf_url(fields)
         if not pdf_url:
             skipped.append((key, "no PDF url found"))
             continue
 
-        filename = f"{key}.pdf"
-        dest_path = os.path.join(args.out, filename)
-        if os.path.exists(dest_path) and not args.force:
-            print(f"[{index}/{total}] {filename} already exists, skipping.")
-            continue
+        jobs.append((index, key, pdf_url, dest_path))
 
-        try:
-            download_with_progress(pdf_url, dest_path, index, total)
-            print(f"[{index}/{total}] Downloaded {filename}")
-        except (HTTPError, URLError, TimeoutError) as exc:
-            failed.append((key, str(exc)))
-            if os.path.exists(dest_path):
-                os.remove(dest_path)
-            print(f"[{index}/{total}] Failed {filename}: {exc}")
-        time.sleep(args.delay)
+    print(f"{present} already present, {len(jobs)} to fetch.")
+
+    workers = max(1, args.workers)
+    limiter = HostRateLimiter(args.delay)
+    revalidate = args.refresh and not args.force
+
+    def report(index, key, status, error):
+        if status == "failed":
+            failed.append((key, error))
+            print(f"[{index}/{total}] Failed {key}.pdf: {error}")
+        elif status == "unchanged":
+            print(f"[{index}/{total}] {key}.pdf is up to date")
+        else:
+            print(f"[{index}/{total}] Downloaded {key}.pdf")
+
+    if aiohttp is not None and not args.sync:
+        asyncio.run(download_all_async(jobs, total, workers, limiter, revalidate, report))
+    else:
+        download_all(jobs, total, workers, limiter, revalidate, report)
 
     if skipped:
         print("\nSkipped entries:")